@@ -39,6 +39,10 @@ const aiInsightService = new AIInsightService(API_BASE);
 const sparklineBuilder = new SparklineBuilder();
 
 const w = Dimensions.get('window').width;
+// Sparkline geometry is fixed for the session, so compute it once
+const SPARK_WIDTH = w - 48 - 24;
+const SPARK_HEIGHT = 48;
+const SPARK_VIEWBOX = `0 0 ${SPARK_WIDTH} ${SPARK_HEIGHT}`;
 
 const App = (): React.JSX.Element => {
   const [cards, setCards] = useState<StockCard[]>(() => deckService.generateBatch());
@@ -89,18 +93,14 @@ const App = (): React.JSX.Element => {
     const nextCards = cards.slice(index + 3, index + 5).filter(Boolean) as StockCard[];
     // Priority loading: visible cards first, then next cards
     const loadCardData = async (card: StockCard, priority: 'high' | 'low') => {
-      const stale =
-        !rt[card.ticker] || Date.now() - (rt[card.ticker]?.lastUpdated || 0) > 30_000;
-      
-      if (stale) {
-        // Add small delay for low priority cards to not block UI
-        if (priority === 'low') {
-          await new Promise(resolve => setTimeout(resolve, 100));
-        }
-        
-        const data = await yahooFinanceService.fetchRealtime(card.ticker);
-        setRt((m) => ({ ...m, [card.ticker]: data }));
+      // Freshness is owned by the service cache; only cards that need the network
+      // get the low-priority delay
+      if (priority === 'low' && !yahooFinanceService.getCached(card.ticker)) {
+        await new Promise(resolve => setTimeout(resolve, 100));
       }
+
+      const data = await yahooFinanceService.fetchRealtime(card.ticker);
+      setRt((m) => (m[card.ticker] === data ? m : { ...m, [card.ticker]: data }));
     };
     
     // Load visible cards immediately (high priority)
@@ -147,13 +147,14 @@ const App = (): React.JSX.Element => {
     if (topCard) {
       const live = rt[topCard.ticker];
       const price = live?.price || 0;
+      const now = Date.now();
       
       const transaction: BuyTransaction = {
-        id: `${topCard.ticker}-${Date.now()}`,
+        id: `${topCard.ticker}-${now}`,
         ticker: topCard.ticker,
         name: topCard.name,
         price: price,
-        timestamp: Date.now(),
+        timestamp: now,
       };
       
       setBuyHistory(prev => [...prev, transaction]);
@@ -307,7 +308,7 @@ const App = (): React.JSX.Element => {
         : '#9aa6bf';
     const debugError = live?.debugError;
 
-    const path = live?.spark?.length ? sparklineBuilder.buildPath(live.spark, w - 48 - 24, 48) : '';
+    const path = live?.spark?.length ? sparklineBuilder.buildPath(live.spark, SPARK_WIDTH, SPARK_HEIGHT) : '';
 
     return (
       <View style={styles.card}>
@@ -343,7 +344,7 @@ const App = (): React.JSX.Element => {
         {/* Sparkline */}
         <View style={{ height: 56, marginTop: 12 }}>
           {path ? (
-            <Svg width="100%" height="100%" viewBox={`0 0 ${w - 48 - 24} 48`}>
+            <Svg width="100%" height="100%" viewBox={SPARK_VIEWBOX}>
               <Path d={path} stroke="#6ee7b7" strokeWidth={2} fill="none" />
             </Svg>
           ) : (
@@ -34,6 +34,9 @@ export type AIInsight = {
 };
 
 const DEFAULT_BATCH_SIZE = 12;
+const DEFAULT_REALTIME_TTL_MS = 30_000;
+const DEFAULT_REALTIME_ERROR_TTL_MS = 10_000;
+const DEFAULT_REALTIME_TIMEOUT_MS = 10_000;
 
 const DEFAULT_STOCK_UNIVERSE: readonly StockDescriptor[] = [
   { ticker: 'AAPL', name: 'Apple Inc.' },
@@ -63,6 +66,13 @@ const resolveApiBase = (): string => {
   return base.replace(/\/$/, '');
 };
 
+// Per-request tracing is only useful while developing; skip the bridge I/O in release builds
+const debugLog = (...args: unknown[]): void => {
+  if (__DEV__) {
+    console.log(...args);
+  }
+};
+
 export const API_BASE = resolveApiBase();
 export const STOCK_UNIVERSE = DEFAULT_STOCK_UNIVERSE;
 
@@ -75,10 +85,11 @@ export class StockDeckService {
   generateBatch(size = this.defaultBatchSize): StockCard[] {
     const pool = this.shuffle(this.universe);
     const batch: StockCard[] = [];
+    const now = Date.now();
     for (let i = 0; i < size; i++) {
       const descriptor = pool[i % pool.length];
       batch.push({
-        id: `${descriptor.ticker}-${Math.random().toString(16).slice(2, 8)}-${Date.now()}`,
+        id: `${descriptor.ticker}-${Math.random().toString(16).slice(2, 8)}-${now}`,
         ticker: descriptor.ticker,
         name: descriptor.name,
       });
@@ -97,20 +108,59 @@ export class StockDeckService {
 }
 
 export class YahooFinanceService {
-  constructor(private readonly baseUrl: string = API_BASE) {}
+  private readonly cache = new Map<string, Realtime>();
+  private readonly inflight = new Map<string, Promise<Realtime>>();
+
+  constructor(
+    private readonly baseUrl: string = API_BASE,
+    private readonly cacheTtlMs = DEFAULT_REALTIME_TTL_MS,
+    private readonly errorTtlMs = DEFAULT_REALTIME_ERROR_TTL_MS,
+    private readonly timeoutMs = DEFAULT_REALTIME_TIMEOUT_MS
+  ) {}
+
+  fetchRealtime(ticker: string): Promise<Realtime> {
+    const cached = this.getCached(ticker);
+    if (cached) {
+      return Promise.resolve(cached);
+    }
+
+    // Single-flight: concurrent callers for the same ticker share one request
+    const pending = this.inflight.get(ticker);
+    if (pending) return pending;
+
+    const request = this.requestRealtime(ticker).then((data) => {
+      this.inflight.delete(ticker);
+      // Failures are kept briefly too, so an API outage is not retried on every swipe
+      this.cache.set(ticker, data);
+      return data;
+    });
+    this.inflight.set(ticker, request);
+    return request;
+  }
+
+  getCached(ticker: string): Realtime | undefined {
+    const cached = this.cache.get(ticker);
+    if (!cached) return undefined;
+    const ttl = cached.debugError ? this.errorTtlMs : this.cacheTtlMs;
+    return Date.now() - cached.lastUpdated < ttl ? cached : undefined;
+  }
 
-  async fetchRealtime(ticker: string): Promise<Realtime> {
+  private async requestRealtime(ticker: string): Promise<Realtime> {
+    // fetch has no timeout of its own; abort so a hung request cannot pin the in-flight entry
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), this.timeoutMs);
     try {
-      console.log('YahooFinanceService.fetchRealtime ->', ticker, `${this.baseUrl}/api/yahoo`);
+      debugLog('YahooFinanceService.fetchRealtime ->', ticker, `${this.baseUrl}/api/yahoo`);
       const response = await fetch(
-        `${this.baseUrl}/api/yahoo?symbol=${encodeURIComponent(ticker)}`
+        `${this.baseUrl}/api/yahoo?symbol=${encodeURIComponent(ticker)}`,
+        { signal: controller.signal }
       );
       if (!response.ok) {
         throw new Error(`Yahoo fetch failed ${response.status}`);
       }
 
       const data = await response.json();
-      console.log('YahooFinanceService.fetchRealtime ok ->', ticker, {
+      debugLog('YahooFinanceService.fetchRealtime ok ->', ticker, {
         price: data?.price,
         changePct: data?.changePct,
         sparkLen: Array.isArray(data?.spark) ? data.spark.length : 0,
@@ -134,6 +184,8 @@ export class YahooFinanceService {
         lastUpdated: Date.now(),
         debugError: String(error),
       };
+    } finally {
+      clearTimeout(timer);
     }
   }
 }
@@ -147,7 +199,7 @@ export class AIInsightService {
     snapshot: { price: number | null; changePct: number | null }
   ): Promise<AIInsight | null> {
     try {
-      console.log('AIInsightService.fetchInsight ->', symbol, `${this.baseUrl}/api/rationale`);
+      debugLog('AIInsightService.fetchInsight ->', symbol, `${this.baseUrl}/api/rationale`);
       const response = await fetch(`${this.baseUrl}/api/rationale`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -164,7 +216,7 @@ export class AIInsightService {
       }
 
       const data = (await response.json()) as AIInsight;
-      console.log('AIInsightService.fetchInsight ok ->', symbol, {
+      debugLog('AIInsightService.fetchInsight ok ->', symbol, {
         buyP: data.buyProbability,
         sellP: data.sellProbability,
       });